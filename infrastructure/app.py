@@ -4,7 +4,7 @@ CDK application entry point for OurChants frontend infrastructure.
 
 This file:
 - Initializes the CDK app
-- Creates the OurChants frontend stack
+- Creates the OurChants frontend stack (including the blog API)
 - Creates the GitHub OIDC deployment role stack
 """
 
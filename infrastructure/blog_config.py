@@ -0,0 +1,131 @@
+"""
+Blog API configuration for OurChants website.
+
+This module provisions the dynamic blog backend for the CDK stack:
+- DynamoDB table (on-demand) with a date-sorted index
+- arm64 Python Lambda running lambda/blog.py
+- Optional provisioned concurrency or SnapStart on a "live" alias
+- Public function URL for reads (GET only)
+- IAM-authenticated function URL on an "admin" alias for creating posts
+
+Tuning is read from the environment (see .env):
+- BLOG_LAMBDA_MEMORY_MB: memory size in MB (default 512, pick with power_tuning.py)
+- BLOG_PROVISIONED_CONCURRENCY: pre-warmed instances on the alias (default 0)
+- BLOG_SNAPSTART: "true" to enable SnapStart instead of provisioned concurrency
+"""
+
+import os
+
+from aws_cdk import (
+    aws_dynamodb as dynamodb,
+    aws_lambda as lambda_,
+    Duration,
+    RemovalPolicy,
+    Stack,
+)
+
+BLOG_DATE_INDEX_NAME = "by-date"
+BLOG_POST_TYPE = "post"
+DEFAULT_MEMORY_MB = 512
+
+
+class BlogApiConfig:
+    def __init__(
+        self,
+        stack: Stack,
+        memory_size: int = DEFAULT_MEMORY_MB,
+        provisioned_concurrency: int = 0,
+        snap_start: bool = False,
+    ):
+        if not 128 <= memory_size <= 10240:
+            raise ValueError(f"Blog Lambda memory must be between 128 and 10240 MB, got {memory_size}")
+        if provisioned_concurrency < 0:
+            raise ValueError("Blog provisioned concurrency cannot be negative")
+        if provisioned_concurrency and snap_start:
+            # Lambda rejects SnapStart on versions that have provisioned concurrency
+            raise ValueError("Choose either BLOG_PROVISIONED_CONCURRENCY or BLOG_SNAPSTART, not both")
+
+        self.stack = stack
+        self.memory_size = memory_size
+        self.provisioned_concurrency = provisioned_concurrency
+        self.snap_start = snap_start
+        self._setup_table()
+        self._setup_function()
+
+    @classmethod
+    def from_env(cls, stack: Stack) -> "BlogApiConfig":
+        """Build the blog API from BLOG_* environment variables."""
+        return cls(
+            stack,
+            memory_size=int(os.getenv("BLOG_LAMBDA_MEMORY_MB", DEFAULT_MEMORY_MB)),
+            provisioned_concurrency=int(os.getenv("BLOG_PROVISIONED_CONCURRENCY", "0")),
+            snap_start=os.getenv("BLOG_SNAPSTART", "false").lower() == "true",
+        )
+
+    def _setup_table(self):
+        self.table = dynamodb.Table(
+            self.stack,
+            "BlogTable",
+            partition_key=dynamodb.Attribute(name="id", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
+        # Every post shares post_type so one query returns the feed already sorted by date
+        self.table.add_global_secondary_index(
+            index_name=BLOG_DATE_INDEX_NAME,
+            partition_key=dynamodb.Attribute(name="post_type", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="created_at", type=dynamodb.AttributeType.STRING),
+            projection_type=dynamodb.ProjectionType.ALL,
+        )
+
+    def _setup_function(self):
+        lambda_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lambda")
+
+        self.function = lambda_.Function(
+            self.stack,
+            "BlogFunction",
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            handler="blog.lambda_handler",
+            code=lambda_.Code.from_asset(lambda_dir),
+            memory_size=self.memory_size,
+            # Creating a post may wait on image variant generation (60 s timeout) for a new upload
+            timeout=Duration.seconds(90),
+            snap_start=lambda_.SnapStartConf.ON_PUBLISHED_VERSIONS if self.snap_start else None,
+            environment={
+                "BLOG_TABLE_NAME": self.table.table_name,
+                "BLOG_DATE_INDEX_NAME": BLOG_DATE_INDEX_NAME,
+            },
+        )
+        self.table.grant_read_write_data(self.function)
+
+        # Pre-warming and SnapStart both apply to published versions, so traffic goes through an alias
+        self.alias = lambda_.Alias(
+            self.stack,
+            "BlogFunctionLiveAlias",
+            alias_name="live",
+            version=self.function.current_version,
+            provisioned_concurrent_executions=self.provisioned_concurrency or None,
+        )
+
+        # CORS only limits browsers; blog.py also rejects writes without an IAM caller
+        self.function_url = self.alias.add_function_url(
+            auth_type=lambda_.FunctionUrlAuthType.NONE,
+            cors=lambda_.FunctionUrlCorsOptions(
+                allowed_origins=["*"],
+                allowed_methods=[lambda_.HttpMethod.GET],
+                allowed_headers=["Content-Type", "Accept"],
+            ),
+        )
+
+        # Writes need SigV4-signed requests from a principal granted lambda:InvokeFunctionUrl
+        self.admin_alias = lambda_.Alias(
+            self.stack,
+            "BlogFunctionAdminAlias",
+            alias_name="admin",
+            version=self.function.current_version,
+        )
+        self.admin_function_url = self.admin_alias.add_function_url(
+            auth_type=lambda_.FunctionUrlAuthType.AWS_IAM,
+        )
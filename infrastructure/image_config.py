@@ -0,0 +1,125 @@
+"""
+Image variant configuration for OurChants website.
+
+This module provisions the responsive image pipeline for the CDK stack:
+- Private S3 bucket for uploaded originals (uploads/) and variants (images/)
+- arm64 Python Lambda running lambda/image_variants.py with Pillow bundled
+- S3 upload notification so variants are generated as soon as an original lands
+- Dedicated CloudFront distribution serving images/* with year-long immutable caching
+
+Images get their own distribution because the site distribution rewrites
+403/404 to index.html for the SPA, which would hand <img> tags HTML.
+"""
+
+import os
+
+from aws_cdk import (
+    aws_cloudfront as cloudfront,
+    aws_cloudfront_origins as cloudfront_origins,
+    aws_iam as iam,
+    aws_lambda as lambda_,
+    aws_s3 as s3,
+    aws_s3_notifications as s3n,
+    BundlingOptions,
+    Duration,
+    RemovalPolicy,
+    Stack,
+)
+
+UPLOAD_PREFIX = "uploads/"
+VARIANT_PREFIX = "images/"
+
+
+class ImageVariantsConfig:
+    def __init__(self, stack: Stack):
+        self.stack = stack
+        self._setup_bucket()
+        self._setup_function()
+        self._setup_distribution()
+
+    def _setup_bucket(self):
+        self.bucket = s3.Bucket(
+            self.stack,
+            "BlogImagesBucket",
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            enforce_ssl=True,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
+    def _setup_function(self):
+        lambda_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lambda")
+
+        self.function = lambda_.Function(
+            self.stack,
+            "ImageVariantsFunction",
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            handler="image_variants.lambda_handler",
+            code=lambda_.Code.from_asset(
+                lambda_dir,
+                bundling=BundlingOptions(
+                    image=lambda_.Runtime.PYTHON_3_12.bundling_image,
+                    platform="linux/arm64",
+                    command=[
+                        "bash", "-c",
+                        "pip install -r requirements-images.txt -t /asset-output && cp image_variants.py /asset-output",
+                    ],
+                ),
+            ),
+            # AVIF encoding is CPU bound, and Lambda CPU scales with memory
+            memory_size=2048,
+            timeout=Duration.seconds(60),
+            environment={
+                "IMAGE_BUCKET_NAME": self.bucket.bucket_name,
+            },
+        )
+        self.bucket.grant_read(self.function, f"{UPLOAD_PREFIX}*")
+        self.bucket.grant_read_write(self.function, f"{VARIANT_PREFIX}*")
+
+        self.bucket.add_event_notification(
+            s3.EventType.OBJECT_CREATED,
+            s3n.LambdaDestination(self.function),
+            s3.NotificationKeyFilter(prefix=UPLOAD_PREFIX),
+        )
+
+    def _setup_distribution(self):
+        # Variant keys are content-addressed, so a URL never changes meaning
+        immutable_policy = cloudfront.CachePolicy(
+            self.stack,
+            "ImmutableImagesCachePolicy",
+            default_ttl=Duration.days(365),
+            min_ttl=Duration.days(365),
+            max_ttl=Duration.days(365),
+            enable_accept_encoding_gzip=False,
+            enable_accept_encoding_brotli=False,
+        )
+
+        self.distribution = cloudfront.Distribution(
+            self.stack,
+            "BlogImagesDistribution",
+            default_behavior=cloudfront.BehaviorOptions(
+                origin=cloudfront_origins.S3BucketOrigin.with_origin_access_control(self.bucket),
+                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
+                cache_policy=immutable_policy,
+                compress=False,
+            ),
+        )
+
+        # The origin access grant covers the whole bucket; keep full-size originals off the CDN
+        self.bucket.add_to_resource_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.DENY,
+                principals=[iam.ServicePrincipal("cloudfront.amazonaws.com")],
+                actions=["s3:GetObject"],
+                resources=[self.bucket.arn_for_objects(f"{UPLOAD_PREFIX}*")],
+            )
+        )
+
+        self.base_url = f"https://{self.distribution.distribution_domain_name}"
+        self.function.add_environment("IMAGE_BASE_URL", self.base_url)
+
+    def grant_variants_to(self, grantee: lambda_.Function):
+        """Let another function (the blog API) request variants on first use."""
+        self.function.grant_invoke(grantee)
+        grantee.add_environment("IMAGE_FUNCTION_NAME", self.function.function_name)
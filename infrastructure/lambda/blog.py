@@ -1,11 +1,31 @@
 import json
 import boto3
+from botocore.config import Config
 from datetime import datetime
+from decimal import Decimal
 from boto3.dynamodb.conditions import Key
 import os
 
 dynamodb = boto3.resource('dynamodb')
+# Image generation can take up to the image Lambda's 60 s timeout; the default
+# 60 s read timeout (and retries) would abandon or duplicate that work
+lambda_client = boto3.client('lambda', config=Config(read_timeout=75, retries={'total_max_attempts': 1}))
 table = dynamodb.Table(os.environ['BLOG_TABLE_NAME'])
+date_index_name = os.environ.get('BLOG_DATE_INDEX_NAME', 'by-date')
+image_function_name = os.environ.get('IMAGE_FUNCTION_NAME')
+
+# Partition key shared by every post so the date index returns the whole feed in order
+POST_TYPE = 'post'
+
+def decimal_default(value):
+    # DynamoDB returns numbers (e.g. image dimensions) as Decimal
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def is_iam_authorized(event):
+    # Only the AWS_IAM function URL passes a verified caller; the public URL never does
+    return bool(event['requestContext'].get('authorizer', {}).get('iam'))
 
 def lambda_handler(event, context):
     http_method = event['requestContext']['http']['method']
@@ -13,6 +33,11 @@ def lambda_handler(event, context):
     if http_method == 'GET':
         return get_posts(event)
     elif http_method == 'POST':
+        if not is_iam_authorized(event):
+            return {
+                'statusCode': 403,
+                'body': json.dumps({'error': 'Creating posts requires the authenticated admin endpoint'})
+            }
         return create_post(event)
     else:
         return {
@@ -22,16 +47,22 @@ def lambda_handler(event, context):
 
 def get_posts(event):
     try:
-        # Get all posts, sorted by date
-        response = table.scan()
+        # Get all posts from the date index, newest first
+        query_kwargs = {
+            'IndexName': date_index_name,
+            'KeyConditionExpression': Key('post_type').eq(POST_TYPE),
+            'ScanIndexForward': False
+        }
+        response = table.query(**query_kwargs)
         posts = response.get('Items', [])
         
-        # Sort posts by date (newest first)
-        posts.sort(key=lambda x: x['created_at'], reverse=True)
+        while 'LastEvaluatedKey' in response:
+            response = table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **query_kwargs)
+            posts.extend(response.get('Items', []))
         
         return {
             'statusCode': 200,
-            'body': json.dumps(posts)
+            'body': json.dumps(posts, default=decimal_default)
         }
     except Exception as e:
         return {
@@ -39,6 +70,24 @@ def get_posts(event):
             'body': json.dumps({'error': str(e)})
         }
 
+class ImageProcessingError(Exception):
+    pass
+
+def get_image_variants(image_key):
+    # Returns the stored manifest, or generates the variants now if the upload
+    # event has not been processed yet
+    response = lambda_client.invoke(
+        FunctionName=image_function_name,
+        Payload=json.dumps({'source_key': image_key})
+    )
+    manifest = json.loads(response['Payload'].read())
+    if response.get('FunctionError'):
+        # Unhandled failures (timeout, out of memory) return {"errorMessage": ...}
+        raise ImageProcessingError(manifest.get('errorMessage', response['FunctionError']))
+    if 'error' in manifest:
+        raise ValueError(manifest['error'])
+    return manifest
+
 def create_post(event):
     try:
         body = json.loads(event['body'])
@@ -55,6 +104,7 @@ def create_post(event):
         # Create post
         post = {
             'id': str(datetime.now().timestamp()),
+            'post_type': POST_TYPE,
             'title': body['title'],
             'content': body['content'],
             'author': body['author'],
@@ -63,6 +113,25 @@ def create_post(event):
             'image_url': body.get('image_url')
         }
         
+        # Uploaded originals are served as responsive variants instead of as-is
+        if body.get('image_key') and image_function_name:
+            try:
+                manifest = get_image_variants(body['image_key'])
+            except ValueError as e:
+                return {
+                    'statusCode': 400,
+                    'body': json.dumps({'error': f'Invalid image_key: {e}'})
+                }
+            except ImageProcessingError as e:
+                return {
+                    'statusCode': 502,
+                    'body': json.dumps({'error': f'Image processing failed: {e}'})
+                }
+            post['image_url'] = manifest['fallback']
+            post['image_srcset'] = manifest['srcset']
+            post['image_width'] = manifest['width']
+            post['image_height'] = manifest['height']
+        
         table.put_item(Item=post)
         
         return {
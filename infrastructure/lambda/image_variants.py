@@ -0,0 +1,215 @@
+"""
+Responsive image variants for blog post images.
+
+Originals uploaded to the images bucket under uploads/ are resized to fixed
+widths in WebP and AVIF and stored content-addressed under images/<hash>/,
+next to a manifest.json describing the variants and their srcset strings.
+
+The handler runs either from an S3 ObjectCreated event (on upload) or by
+direct invocation with {"source_key": "uploads/..."} (on first request, used
+by the blog Lambda). Processing is idempotent: an existing manifest is reused.
+
+Run locally against sample images:
+    python image_variants.py photo.jpg --out ./variants
+"""
+
+import hashlib
+import io
+import json
+import os
+from urllib.parse import unquote_plus
+
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+VARIANT_WIDTHS = (320, 640, 960, 1280, 1920)
+FORMAT_OPTIONS = {
+    'avif': {'content_type': 'image/avif', 'save': {'quality': 50}},
+    'webp': {'content_type': 'image/webp', 'save': {'quality': 80, 'method': 6}},
+}
+CACHE_CONTROL = 'public, max-age=31536000, immutable'
+UPLOAD_PREFIX = 'uploads/'
+VARIANT_PREFIX = 'images/'
+
+_s3_client = None
+
+
+def _s3():
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+        _s3_client = boto3.client('s3')
+    return _s3_client
+
+
+def supported_formats():
+    """Output formats this Pillow build can encode, smallest first."""
+    return [fmt for fmt in FORMAT_OPTIONS if features.check(fmt)]
+
+
+def content_hash(image_bytes, widths=VARIANT_WIDTHS, formats=None):
+    """
+    Address for one original under one set of variant settings.
+
+    Widths, formats and encoder options are hashed with the bytes, so changing
+    any of them writes new keys instead of reusing immutable cached ones.
+    """
+    formats = formats or supported_formats()
+    settings = json.dumps({
+        'widths': list(widths),
+        'formats': {fmt: FORMAT_OPTIONS[fmt]['save'] for fmt in formats},
+    }, sort_keys=True)
+    return hashlib.sha256(settings.encode() + image_bytes).hexdigest()[:16]
+
+
+def target_widths(original_width, widths=VARIANT_WIDTHS):
+    """Fixed widths no larger than the original; small originals keep their own width."""
+    selected = [w for w in widths if w < original_width]
+    if original_width <= widths[-1]:
+        selected.append(original_width)
+    return selected or [original_width]
+
+
+def generate_variants(image_bytes, widths=VARIANT_WIDTHS, formats=None):
+    """
+    Resize an image to each target width in each output format.
+
+    Returns (digest, original_size, variants) where every variant is a dict with
+    key, width, height, format, content_type and body.
+    """
+    formats = formats or supported_formats()
+    digest = content_hash(image_bytes, widths, formats)
+
+    with Image.open(io.BytesIO(image_bytes)) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        original_size = image.size
+
+        variants = []
+        for width in target_widths(image.width, widths):
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+            for fmt in formats:
+                buffer = io.BytesIO()
+                resized.save(buffer, format=fmt.upper(), **FORMAT_OPTIONS[fmt]['save'])
+                variants.append({
+                    'key': f'{VARIANT_PREFIX}{digest}/{width}w.{fmt}',
+                    'width': width,
+                    'height': height,
+                    'format': fmt,
+                    'content_type': FORMAT_OPTIONS[fmt]['content_type'],
+                    'body': buffer.getvalue(),
+                })
+
+    return digest, original_size, variants
+
+
+def build_manifest(source_key, digest, original_size, variants, base_url=''):
+    """Describe stored variants, including a srcset string per format."""
+    base_url = base_url.rstrip('/')
+    entries = [
+        {k: v for k, v in variant.items() if k != 'body'} | {'bytes': len(variant['body'])}
+        for variant in variants
+    ]
+
+    srcset = {}
+    for entry in entries:
+        srcset.setdefault(entry['format'], []).append(f"{base_url}/{entry['key']} {entry['width']}w")
+
+    # Largest WebP is the most widely supported fallback for <img src>
+    fallback_format = 'webp' if 'webp' in srcset else entries[-1]['format']
+    fallback = max((e for e in entries if e['format'] == fallback_format), key=lambda e: e['width'])
+
+    return {
+        'source': source_key,
+        'hash': digest,
+        'width': original_size[0],
+        'height': original_size[1],
+        'variants': entries,
+        'srcset': {fmt: ', '.join(items) for fmt, items in srcset.items()},
+        'fallback': f"{base_url}/{fallback['key']}",
+    }
+
+
+def process_image(bucket, source_key):
+    """Generate and store variants for an uploaded original, returning its manifest."""
+    s3 = _s3()
+    image_bytes = s3.get_object(Bucket=bucket, Key=source_key)['Body'].read()
+    digest = content_hash(image_bytes)
+    manifest_key = f'{VARIANT_PREFIX}{digest}/manifest.json'
+
+    try:
+        existing = s3.get_object(Bucket=bucket, Key=manifest_key)
+        return json.loads(existing['Body'].read())
+    except s3.exceptions.NoSuchKey:
+        pass
+
+    digest, original_size, variants = generate_variants(image_bytes)
+    for variant in variants:
+        s3.put_object(
+            Bucket=bucket,
+            Key=variant['key'],
+            Body=variant['body'],
+            ContentType=variant['content_type'],
+            CacheControl=CACHE_CONTROL,
+        )
+
+    manifest = build_manifest(source_key, digest, original_size, variants, os.environ.get('IMAGE_BASE_URL', ''))
+    # Written last so its presence means every variant is in place
+    s3.put_object(
+        Bucket=bucket,
+        Key=manifest_key,
+        Body=json.dumps(manifest),
+        ContentType='application/json',
+        CacheControl=CACHE_CONTROL,
+    )
+    return manifest
+
+
+def lambda_handler(event, context):
+    if 'source_key' in event:
+        source_key = event['source_key']
+        if not source_key.startswith(UPLOAD_PREFIX):
+            return {'error': f'Images must be uploaded under {UPLOAD_PREFIX}'}
+        # Bad input is reported to the caller; anything else fails the invocation
+        try:
+            return process_image(os.environ['IMAGE_BUCKET_NAME'], source_key)
+        except _s3().exceptions.NoSuchKey:
+            return {'error': f'No uploaded image at {source_key}'}
+        except UnidentifiedImageError:
+            return {'error': f'{source_key} is not a readable image'}
+
+    manifests = []
+    for record in event.get('Records', []):
+        bucket = record['s3']['bucket']['name']
+        source_key = unquote_plus(record['s3']['object']['key'])
+        manifests.append(process_image(bucket, source_key))
+    return {'processed': len(manifests)}
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate responsive variants for a local image')
+    parser.add_argument('image', help='Path to the original image')
+    parser.add_argument('--out', default='variants', help='Directory to write variants and manifest.json to')
+    parser.add_argument('--base-url', default='', help='URL prefix used in the srcset strings')
+    args = parser.parse_args()
+
+    with open(args.image, 'rb') as f:
+        source = f.read()
+
+    digest, size, variants = generate_variants(source)
+    for variant in variants:
+        path = os.path.join(args.out, variant['key'])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(variant['body'])
+
+    manifest = build_manifest(os.path.basename(args.image), digest, size, variants, args.base_url)
+    with open(os.path.join(args.out, VARIANT_PREFIX, digest, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    total = sum(v['bytes'] for v in manifest['variants'])
+    print(f'{len(source)} bytes -> {len(variants)} variants ({total} bytes total) in {args.out}')
+    for fmt, srcset in manifest['srcset'].items():
+        print(f'{fmt}: {srcset}')
@@ -0,0 +1,224 @@
+"""
+Waveform peaks and duration for uploaded songs.
+
+Each audio file created in the songs bucket is decoded to mono PCM and
+reduced to min/max peak pairs at several fixed resolutions. The result is
+written next to the audio as <key>.peaks, a few KB the player can draw
+immediately instead of downloading the whole track.
+
+Sidecar layout (little-endian):
+    header  magic b"OCPK", u8 version, u8 level count, u16 reserved,
+            f32 duration in seconds, u32 sample rate of the analysis
+    levels  u32 bin count per level, finest first
+    data    per level, bin count interleaved (min, max) int8 pairs
+
+WAV is decoded with the standard library; other formats go through ffmpeg
+from the hash-pinned imageio-ffmpeg wheel (or FFMPEG_PATH / PATH locally).
+
+Run locally against a sample track:
+    python waveform_peaks.py song.mp3
+"""
+
+import io
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+import wave
+from urllib.parse import unquote_plus
+
+import numpy as np
+
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.m4a', '.ogg')
+SIDECAR_SUFFIX = '.peaks'
+MAGIC = b'OCPK'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sBBHfI')
+
+# Each coarser level evenly divides the finest, so it is derived by reshaping
+PEAK_LEVELS = (2048, 512, 128)
+ANALYSIS_SAMPLE_RATE = 8000
+# <key>.peaks is rewritten when a track is re-uploaded under the same key,
+# so caches must revalidate against the ETag instead of keeping a stale copy
+CACHE_CONTROL = 'no-cache'
+
+_s3_client = None
+
+
+def _s3():
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+        _s3_client = boto3.client('s3')
+    return _s3_client
+
+
+def _ffmpeg_path():
+    if os.environ.get('FFMPEG_PATH'):
+        return os.environ['FFMPEG_PATH']
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        return shutil.which('ffmpeg')
+
+
+def decode_wav(audio_bytes):
+    """Decode PCM WAV to mono float32 samples in [-1, 1] and its sample rate."""
+    with wave.open(io.BytesIO(audio_bytes)) as wav:
+        channels = wav.getnchannels()
+        width = wav.getsampwidth()
+        rate = wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+
+    if width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 2:
+        samples = np.frombuffer(frames, dtype='<i2').astype(np.float32) / 32768
+    elif width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        # Sign-extend 24-bit little-endian samples into int32
+        samples = (raw[:, 0].astype(np.int32) | (raw[:, 1].astype(np.int32) << 8)
+                   | (raw[:, 2].astype(np.int8).astype(np.int32) << 16)).astype(np.float32) / 8388608
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype='<i4').astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f'Unsupported WAV sample width: {width} bytes')
+
+    return samples.reshape(-1, channels).mean(axis=1), rate
+
+
+def decode_ffmpeg(audio_bytes, extension, sample_rate=ANALYSIS_SAMPLE_RATE):
+    """Decode any ffmpeg-readable audio to mono float32 samples at sample_rate."""
+    ffmpeg = _ffmpeg_path()
+    if not ffmpeg:
+        raise RuntimeError('ffmpeg not found; set FFMPEG_PATH to decode compressed audio')
+
+    # ffmpeg needs a seekable input: MP4/M4A files often keep the moov atom at the end
+    with tempfile.NamedTemporaryFile(suffix=extension) as source:
+        source.write(audio_bytes)
+        source.flush()
+        result = subprocess.run(
+            [ffmpeg, '-v', 'error', '-i', source.name, '-ac', '1', '-ar', str(sample_rate), '-f', 'f32le', 'pipe:1'],
+            capture_output=True,
+            check=True,
+        )
+    return np.frombuffer(result.stdout, dtype='<f4'), sample_rate
+
+
+def decode_audio(audio_bytes, key):
+    extension = os.path.splitext(key)[1].lower()
+    if extension == '.wav':
+        try:
+            return decode_wav(audio_bytes)
+        except (wave.Error, ValueError):
+            # Float or compressed WAV payloads fall back to ffmpeg
+            pass
+    return decode_ffmpeg(audio_bytes, extension)
+
+
+def compute_peaks(samples, levels=PEAK_LEVELS):
+    """
+    Reduce samples to (min, max) pairs for each level.
+
+    Returns a list of int8 arrays shaped (bins, 2), finest level first.
+    """
+    if len(samples) == 0:
+        return [np.zeros((bins, 2), dtype=np.int8) for bins in levels]
+
+    finest = levels[0]
+    if any(finest % bins for bins in levels):
+        raise ValueError(f'Every level must evenly divide {finest}')
+
+    # Bin edges shared by every level; reduceat handles uneven bin sizes without a loop
+    edges = np.linspace(0, len(samples), finest + 1).astype(np.int64)[:-1]
+    mins = np.minimum.reduceat(samples, edges)
+    maxs = np.maximum.reduceat(samples, edges)
+
+    peaks = []
+    for bins in levels:
+        level_min = mins.reshape(bins, -1).min(axis=1)
+        level_max = maxs.reshape(bins, -1).max(axis=1)
+        pairs = np.stack([level_min, level_max], axis=1)
+        peaks.append(np.round(np.clip(pairs, -1, 1) * 127).astype(np.int8))
+    return peaks
+
+
+def encode_sidecar(duration, sample_rate, peaks):
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(peaks), 0, duration, sample_rate)
+    counts = struct.pack(f'<{len(peaks)}I', *(len(level) for level in peaks))
+    return header + counts + b''.join(level.tobytes() for level in peaks)
+
+
+def decode_sidecar(data):
+    """Inverse of encode_sidecar, returning (duration, sample_rate, peaks)."""
+    magic, version, count, _, duration, sample_rate = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError('Not a version 1 waveform peaks sidecar')
+
+    offset = HEADER.size
+    bins = struct.unpack_from(f'<{count}I', data, offset)
+    offset += 4 * count
+
+    peaks = []
+    for n in bins:
+        peaks.append(np.frombuffer(data, dtype=np.int8, count=n * 2, offset=offset).reshape(n, 2))
+        offset += n * 2
+    return duration, sample_rate, peaks
+
+
+def analyze(audio_bytes, key):
+    """Decode a track and return (duration in seconds, sidecar bytes)."""
+    samples, sample_rate = decode_audio(audio_bytes, key)
+    duration = len(samples) / sample_rate
+    return duration, encode_sidecar(duration, sample_rate, compute_peaks(samples))
+
+
+def process_audio(bucket, key):
+    s3 = _s3()
+    audio_bytes = s3.get_object(Bucket=bucket, Key=key)['Body'].read()
+    duration, sidecar = analyze(audio_bytes, key)
+
+    s3.put_object(
+        Bucket=bucket,
+        Key=key + SIDECAR_SUFFIX,
+        Body=sidecar,
+        ContentType='application/octet-stream',
+        CacheControl=CACHE_CONTROL,
+        Metadata={'duration': f'{duration:.3f}'},
+    )
+    return {'key': key, 'duration': round(duration, 3), 'bytes': len(sidecar)}
+
+
+def lambda_handler(event, context):
+    results = []
+    for record in event.get('Records', []):
+        bucket = record['s3']['bucket']['name']
+        key = unquote_plus(record['s3']['object']['key'])
+
+        # Our own sidecar writes must never re-trigger processing
+        if not key.lower().endswith(AUDIO_EXTENSIONS):
+            continue
+        results.append(process_audio(bucket, key))
+
+    return {'processed': len(results), 'results': results}
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compute waveform peaks for a local audio file')
+    parser.add_argument('audio', help='Path to the audio file')
+    parser.add_argument('--out', help=f'Sidecar path (defaults to <audio>{SIDECAR_SUFFIX})')
+    args = parser.parse_args()
+
+    with open(args.audio, 'rb') as f:
+        source = f.read()
+
+    duration, sidecar = analyze(source, args.audio)
+    out = args.out or args.audio + SIDECAR_SUFFIX
+    with open(out, 'wb') as f:
+        f.write(sidecar)
+
+    print(f'{args.audio}: {duration:.2f}s, {len(source)} bytes -> {len(sidecar)} byte sidecar at {out}')
@@ -5,6 +5,9 @@ This stack creates the necessary AWS resources for hosting the OurChants static
 - S3 bucket for static website hosting
 - CloudFront distribution for global content delivery
 - WAF for basic protection
+- Blog API (DynamoDB table + arm64 Lambda; public read URL, IAM-authenticated write URL)
+- Responsive image variants for blog images on their own immutable-cached distribution
+- Waveform peaks + duration sidecars for audio uploaded to the songs bucket
 - Generates the TypeScript API client (songApi.ts) with the correct API endpoint
 
 The stack is designed to work with the existing deployed stacks:
@@ -39,6 +42,9 @@ import boto3
 import time
 from dotenv import load_dotenv
 from domain_config import DomainConfig
+from blog_config import BlogApiConfig
+from image_config import ImageVariantsConfig
+from waveform_config import WaveformPeaksConfig
 
 class OurChantsStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
@@ -220,6 +226,23 @@ class OurChantsStack(Stack):
                 print(f"Warning: Could not configure Route53 record: {str(e)}")
                 print("If the record already exists, you can ignore this warning.")
 
+        # Responsive WebP/AVIF variants of blog images, cached immutably at the edge
+        image_variants = ImageVariantsConfig(self)
+
+        # Precomputed waveform peaks so the player can draw before audio downloads
+        waveform_peaks = WaveformPeaksConfig.from_env(self)
+
+        # Dynamic blog backend (memory/pre-warming tuned via BLOG_* variables in .env)
+        blog_api = BlogApiConfig.from_env(self)
+        image_variants.grant_variants_to(blog_api.function)
+
+        ssm.StringParameter(
+            self, "BlogEndpointParameter",
+            parameter_name="/ourchants/blog-endpoint",
+            string_value=blog_api.function_url.url,
+            description="Public (read-only) blog API function URL"
+        )
+
         # Output the CloudFront URL
         CfnOutput(
             self,
@@ -333,4 +356,53 @@ export const updateSongWithRetry = async (
             "ApiEndpoint",
             value=api_endpoint,
             description="The API Gateway endpoint URL"
-        ) 
\ No newline at end of file
+        )
+
+        CfnOutput(
+            self,
+            "BlogEndpoint",
+            value=blog_api.function_url.url,
+            description="The public (read-only) blog API function URL"
+        )
+
+        CfnOutput(
+            self,
+            "BlogAdminEndpoint",
+            value=blog_api.admin_function_url.url,
+            description="IAM-authenticated blog API function URL for creating posts"
+        )
+
+        CfnOutput(
+            self,
+            "BlogTableName",
+            value=blog_api.table.table_name,
+            description="DynamoDB table holding blog posts"
+        )
+
+        CfnOutput(
+            self,
+            "BlogImagesURL",
+            value=image_variants.base_url,
+            description="CloudFront URL serving blog image variants under /images/"
+        )
+
+        CfnOutput(
+            self,
+            "BlogImagesBucketName",
+            value=image_variants.bucket.bucket_name,
+            description="Upload blog image originals under uploads/ in this bucket"
+        )
+
+        CfnOutput(
+            self,
+            "WaveformPeaksFunctionName",
+            value=waveform_peaks.function.function_name,
+            description="Lambda writing <audio>.peaks sidecars to the songs bucket"
+        )
+
+        CfnOutput(
+            self,
+            "BlogFunctionName",
+            value=blog_api.function.function_name,
+            description="Blog Lambda function name (target for power_tuning.py)"
+        )
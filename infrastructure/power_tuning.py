@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Power-tuning benchmark for the OurChants blog Lambda.
+
+Run this locally against a deployed stack to pick BLOG_LAMBDA_MEMORY_MB:
+- Switches the function through each candidate memory size
+- Invokes it repeatedly and reads billed duration from the Lambda REPORT log line
+- Estimates arm64 cost per invocation and picks the best cost/latency trade-off
+
+Usage:
+    python power_tuning.py <function-name> [--memory 256 512 1024] [--invocations 20] [--strategy balanced]
+
+The function's original memory size is restored when the benchmark finishes.
+"""
+
+import argparse
+import base64
+import json
+import re
+import statistics
+from typing import Dict, Any, List, Optional
+
+# arm64 on-demand pricing (us-east-1)
+PRICE_PER_GB_SECOND = 0.0000133334
+PRICE_PER_REQUEST = 0.0000002
+
+DEFAULT_MEMORY_SIZES = [128, 256, 512, 1024, 1536, 2048]
+STRATEGIES = ("cost", "speed", "balanced")
+
+DEFAULT_PAYLOAD = {"requestContext": {"http": {"method": "GET"}}}
+
+_REPORT_FIELDS = {
+    "duration_ms": r"\tDuration: ([\d.]+) ms",
+    "billed_ms": r"Billed Duration: ([\d.]+) ms",
+    "init_ms": r"Init Duration: ([\d.]+) ms",
+    "max_memory_mb": r"Max Memory Used: (\d+) MB",
+}
+
+
+def parse_report(log_tail: str) -> Dict[str, float]:
+    """Extract timings from the REPORT line of a Lambda log tail."""
+    report = next((line for line in log_tail.splitlines() if line.startswith("REPORT")), None)
+    if report is None:
+        raise ValueError("No REPORT line found in Lambda log output")
+
+    parsed = {}
+    for field, pattern in _REPORT_FIELDS.items():
+        match = re.search(pattern, report)
+        if match:
+            parsed[field] = float(match.group(1))
+    if "billed_ms" not in parsed:
+        raise ValueError(f"Could not read billed duration from: {report}")
+    return parsed
+
+
+def invocation_cost(memory_mb: int, billed_ms: float) -> float:
+    """Estimated USD cost of a single invocation."""
+    return (memory_mb / 1024) * (billed_ms / 1000) * PRICE_PER_GB_SECOND + PRICE_PER_REQUEST
+
+
+def summarize(memory_mb: int, reports: List[Dict[str, float]]) -> Dict[str, Any]:
+    """Aggregate the warm invocations recorded at one memory size."""
+    if not reports:
+        raise ValueError(f"No invocations recorded for {memory_mb} MB")
+
+    billed = [r["billed_ms"] for r in reports]
+    init = [r["init_ms"] for r in reports if "init_ms" in r]
+    return {
+        "memory_mb": memory_mb,
+        "invocations": len(reports),
+        "median_ms": statistics.median(billed),
+        "p95_ms": sorted(billed)[max(0, int(round(0.95 * len(billed))) - 1)],
+        "init_ms": max(init) if init else None,
+        "cost_usd": statistics.mean(invocation_cost(memory_mb, b) for b in billed),
+    }
+
+
+def pick_memory(results: List[Dict[str, Any]], strategy: str = "balanced") -> Dict[str, Any]:
+    """
+    Choose the best result for a strategy.
+
+    "cost" minimises cost per invocation, "speed" minimises median latency and
+    "balanced" minimises the sum of both, each normalised to the best observed value.
+    Ties go to the smaller memory size.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}', expected one of {', '.join(STRATEGIES)}")
+    if not results:
+        raise ValueError("No benchmark results to choose from")
+
+    best_cost = min(r["cost_usd"] for r in results)
+    best_latency = min(r["median_ms"] for r in results)
+
+    def score(result):
+        cost = result["cost_usd"] / best_cost
+        latency = result["median_ms"] / best_latency if best_latency else 1.0
+        if strategy == "cost":
+            return cost
+        if strategy == "speed":
+            return latency
+        return cost + latency
+
+    return min(results, key=lambda r: (score(r), r["memory_mb"]))
+
+
+def benchmark(
+    function_name: str,
+    memory_sizes: List[int],
+    invocations: int,
+    payload: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Invoke the deployed function at each memory size and collect summaries."""
+    import boto3
+
+    client = boto3.client("lambda")
+    waiter = client.get_waiter("function_updated")
+    original_memory = client.get_function_configuration(FunctionName=function_name)["MemorySize"]
+    body = json.dumps(payload or DEFAULT_PAYLOAD).encode()
+
+    results = []
+    try:
+        for memory_mb in memory_sizes:
+            # A configuration change forces a fresh execution environment, so the
+            # first invocation is the cold start and the rest are warm
+            client.update_function_configuration(FunctionName=function_name, MemorySize=memory_mb)
+            waiter.wait(FunctionName=function_name)
+
+            reports = []
+            for _ in range(invocations + 1):
+                response = client.invoke(FunctionName=function_name, Payload=body, LogType="Tail")
+                reports.append(parse_report(base64.b64decode(response["LogResult"]).decode()))
+
+            summary = summarize(memory_mb, reports[1:])
+            summary["init_ms"] = reports[0].get("init_ms")
+            results.append(summary)
+            print(
+                f"{memory_mb:>6} MB  median {summary['median_ms']:>8.1f} ms  "
+                f"p95 {summary['p95_ms']:>8.1f} ms  init {summary['init_ms'] or 0:>7.1f} ms  "
+                f"${summary['cost_usd'] * 1_000_000:.2f} per 1M"
+            )
+    finally:
+        client.update_function_configuration(FunctionName=function_name, MemorySize=original_memory)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pick the best memory size for the blog Lambda")
+    parser.add_argument("function_name", help="Lambda function name (see the BlogFunctionName stack output)")
+    parser.add_argument("--memory", type=int, nargs="+", default=DEFAULT_MEMORY_SIZES, help="Memory sizes in MB")
+    parser.add_argument("--invocations", type=int, default=20, help="Warm invocations per memory size")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="balanced")
+    parser.add_argument("--payload", help="JSON event to send (defaults to a GET /blog request)")
+    args = parser.parse_args()
+
+    payload = json.loads(args.payload) if args.payload else None
+    results = benchmark(args.function_name, args.memory, args.invocations, payload)
+    best = pick_memory(results, args.strategy)
+
+    print(f"\nRecommended ({args.strategy}): BLOG_LAMBDA_MEMORY_MB={best['memory_mb']}")
+
+
+if __name__ == "__main__":
+    main()
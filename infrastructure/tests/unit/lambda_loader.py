@@ -0,0 +1,12 @@
+import importlib.util
+import os
+
+LAMBDA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "lambda")
+
+
+def load_lambda(name):
+    """Import a handler module from lambda/, which is an asset directory rather than a package."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(LAMBDA_DIR, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,92 @@
+import pytest
+
+core = pytest.importorskip("aws_cdk")
+assertions = pytest.importorskip("aws_cdk.assertions")
+
+from infrastructure.blog_config import BlogApiConfig, BLOG_DATE_INDEX_NAME
+
+
+def synth(**kwargs):
+    stack = core.Stack(core.App(), "BlogTest")
+    BlogApiConfig(stack, **kwargs)
+    return assertions.Template.from_stack(stack)
+
+
+def test_table_is_on_demand_with_date_index():
+    template = synth()
+
+    template.has_resource_properties("AWS::DynamoDB::Table", {
+        "BillingMode": "PAY_PER_REQUEST",
+        "GlobalSecondaryIndexes": [
+            assertions.Match.object_like({
+                "IndexName": BLOG_DATE_INDEX_NAME,
+                "KeySchema": [
+                    {"AttributeName": "post_type", "KeyType": "HASH"},
+                    {"AttributeName": "created_at", "KeyType": "RANGE"},
+                ],
+            })
+        ],
+    })
+
+
+def test_function_runs_on_arm64_with_configured_memory():
+    template = synth(memory_size=1024)
+
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Handler": "blog.lambda_handler",
+        "Architectures": ["arm64"],
+        "MemorySize": 1024,
+    })
+
+
+def test_provisioned_concurrency_on_live_alias():
+    template = synth(provisioned_concurrency=2)
+
+    template.has_resource_properties("AWS::Lambda::Alias", {
+        "Name": "live",
+        "ProvisionedConcurrencyConfig": {"ProvisionedConcurrentExecutions": 2},
+    })
+
+
+def test_snap_start_on_published_versions():
+    template = synth(snap_start=True)
+
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "SnapStart": {"ApplyOn": "PublishedVersions"},
+    })
+
+
+def test_rejects_provisioned_concurrency_with_snap_start():
+    with pytest.raises(ValueError):
+        synth(provisioned_concurrency=1, snap_start=True)
+
+
+def test_public_url_is_read_only_and_writes_need_iam():
+    template = synth()
+
+    template.resource_count_is("AWS::Lambda::Url", 2)
+    template.has_resource_properties("AWS::Lambda::Url", {
+        "AuthType": "NONE",
+        "Cors": assertions.Match.object_like({"AllowMethods": ["GET"]}),
+        "Qualifier": "live",
+    })
+    template.has_resource_properties("AWS::Lambda::Url", {
+        "AuthType": "AWS_IAM",
+        "Qualifier": "admin",
+    })
+
+
+def test_public_url_grants_both_invoke_permissions():
+    template = synth()
+
+    # New function URLs also need lambda:InvokeFunction, or every request gets a 403
+    template.has_resource_properties("AWS::Lambda::Permission", {
+        "Action": "lambda:InvokeFunctionUrl",
+        "Principal": "*",
+        "FunctionUrlAuthType": "NONE",
+    })
+    template.has_resource_properties("AWS::Lambda::Permission", {
+        "Action": "lambda:InvokeFunction",
+        "Principal": "*",
+        "InvokedViaFunctionUrl": True,
+    })
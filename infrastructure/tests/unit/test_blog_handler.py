@@ -0,0 +1,76 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from .lambda_loader import load_lambda
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("BLOG_TABLE_NAME", "blog-test")
+blog = load_lambda("blog")
+
+
+def post_event(authorizer=None):
+    context = {"http": {"method": "POST"}}
+    if authorizer is not None:
+        context["authorizer"] = authorizer
+    return {"requestContext": context, "body": json.dumps({"title": "t", "content": "c", "author": "a"})}
+
+
+def test_public_url_cannot_create_posts(monkeypatch):
+    monkeypatch.setattr(blog, "create_post", lambda event: pytest.fail("create_post reached"))
+
+    response = blog.lambda_handler(post_event(), None)
+
+    assert response["statusCode"] == 403
+
+
+def test_iam_caller_can_create_posts(monkeypatch):
+    monkeypatch.setattr(blog, "create_post", lambda event: {"statusCode": 201})
+
+    response = blog.lambda_handler(post_event({"iam": {"userArn": "arn:aws:iam::123456789012:user/editor"}}), None)
+
+    assert response["statusCode"] == 201
+
+
+class FakePayload:
+    def __init__(self, body):
+        self.body = body
+
+    def read(self):
+        return json.dumps(self.body).encode()
+
+
+def image_post_event():
+    event = post_event({"iam": {"userArn": "arn:aws:iam::123456789012:user/editor"}})
+    event["body"] = json.dumps({"title": "t", "content": "c", "author": "a", "image_key": "uploads/chant.jpg"})
+    return event
+
+
+@pytest.fixture
+def image_lambda(monkeypatch):
+    monkeypatch.setattr(blog, "image_function_name", "image-variants")
+    monkeypatch.setattr(blog.table, "put_item", lambda Item: pytest.fail("post stored"))
+
+    def respond(response):
+        monkeypatch.setattr(blog.lambda_client, "invoke", lambda **kwargs: response)
+    return respond
+
+
+def test_image_lambda_failure_returns_502(image_lambda):
+    image_lambda({"FunctionError": "Unhandled", "Payload": FakePayload({"errorMessage": "Task timed out after 60.00 seconds"})})
+
+    response = blog.lambda_handler(image_post_event(), None)
+
+    assert response["statusCode"] == 502
+    assert "Task timed out" in json.loads(response["body"])["error"]
+
+
+def test_missing_image_returns_400(image_lambda):
+    image_lambda({"Payload": FakePayload({"error": "No uploaded image at uploads/chant.jpg"})})
+
+    response = blog.lambda_handler(image_post_event(), None)
+
+    assert response["statusCode"] == 400
@@ -0,0 +1,80 @@
+import pytest
+
+core = pytest.importorskip("aws_cdk")
+assertions = pytest.importorskip("aws_cdk.assertions")
+
+from infrastructure.image_config import ImageVariantsConfig
+
+
+def synth(with_blog=False):
+    # Skip Docker bundling of the Pillow asset; only the template is asserted
+    stack = core.Stack(core.App(context={"aws:cdk:bundling-stacks": []}), "ImagesTest")
+    config = ImageVariantsConfig(stack)
+    if with_blog:
+        blog = core.aws_lambda.Function(
+            stack, "Blog",
+            runtime=core.aws_lambda.Runtime.PYTHON_3_12,
+            handler="blog.lambda_handler",
+            code=core.aws_lambda.Code.from_inline("def lambda_handler(event, context): pass"),
+        )
+        config.grant_variants_to(blog)
+    return config, assertions.Template.from_stack(stack)
+
+
+def test_function_runs_on_arm64_and_fires_on_uploads():
+    _, template = synth()
+
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Handler": "image_variants.lambda_handler",
+        "Architectures": ["arm64"],
+    })
+    template.has_resource_properties("Custom::S3BucketNotifications", {
+        "NotificationConfiguration": {
+            "LambdaFunctionConfigurations": [
+                assertions.Match.object_like({
+                    "Events": ["s3:ObjectCreated:*"],
+                    "Filter": {"Key": {"FilterRules": [{"Name": "prefix", "Value": "uploads/"}]}},
+                })
+            ]
+        }
+    })
+
+
+def test_images_have_their_own_distribution_without_spa_fallback():
+    _, template = synth()
+
+    template.resource_count_is("AWS::CloudFront::Distribution", 1)
+    distribution = next(iter(template.find_resources("AWS::CloudFront::Distribution").values()))
+    assert "CustomErrorResponses" not in distribution["Properties"]["DistributionConfig"]
+
+    template.has_resource_properties("AWS::CloudFront::CachePolicy", {
+        "CachePolicyConfig": assertions.Match.object_like({
+            "DefaultTTL": 31536000,
+            "MinTTL": 31536000,
+        })
+    })
+
+
+def test_originals_are_denied_to_cloudfront():
+    _, template = synth()
+
+    template.has_resource_properties("AWS::S3::BucketPolicy", {
+        "PolicyDocument": {
+            "Statement": assertions.Match.array_with([
+                assertions.Match.object_like({
+                    "Effect": "Deny",
+                    "Action": "s3:GetObject",
+                    "Principal": {"Service": "cloudfront.amazonaws.com"},
+                })
+            ])
+        }
+    })
+
+
+def test_grant_variants_to_blog_function():
+    _, template = synth(with_blog=True)
+
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Handler": "blog.lambda_handler",
+        "Environment": {"Variables": {"IMAGE_FUNCTION_NAME": assertions.Match.any_value()}},
+    })
@@ -0,0 +1,101 @@
+import io
+import random
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from .lambda_loader import load_lambda
+
+image_variants = load_lambda("image_variants")
+
+
+def sample_image(width, height, fmt="PNG", mode="RGB"):
+    # Gradient plus noise behaves like a photo rather than a flat colour
+    noise = random.Random(width * height)
+    image = Image.new(mode, (width, height))
+    image.putdata([((x * 255) // width, (y * 255) // height, noise.randrange(256))
+                   + (((x + y) * 255) // (width + height),) * (mode == "RGBA")
+                   for y in range(height) for x in range(width)])
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def test_target_widths_never_upscale():
+    assert image_variants.target_widths(4000) == [320, 640, 960, 1280, 1920]
+    assert image_variants.target_widths(800) == [320, 640, 800]
+    assert image_variants.target_widths(200) == [200]
+
+
+def test_generate_variants_resizes_each_format():
+    source = sample_image(1000, 500)
+
+    digest, size, variants = image_variants.generate_variants(source, formats=["webp", "avif"])
+
+    assert size == (1000, 500)
+    assert {(v["width"], v["format"]) for v in variants} == {
+        (w, f) for w in (320, 640, 960, 1000) for f in ("webp", "avif")
+    }
+    for variant in variants:
+        assert variant["key"] == f"images/{digest}/{variant['width']}w.{variant['format']}"
+        assert variant["height"] == round(500 * variant["width"] / 1000)
+        with Image.open(io.BytesIO(variant["body"])) as decoded:
+            assert decoded.format == variant["format"].upper()
+            assert decoded.size == (variant["width"], variant["height"])
+
+
+def test_variants_are_content_addressed():
+    first = image_variants.generate_variants(sample_image(400, 300), formats=["webp"])
+    second = image_variants.generate_variants(sample_image(400, 300), formats=["webp"])
+    other = image_variants.generate_variants(sample_image(401, 300), formats=["webp"])
+
+    assert first[0] == second[0]
+    assert first[0] != other[0]
+
+
+def test_digest_changes_with_variant_settings():
+    source = sample_image(400, 300)
+
+    base = image_variants.content_hash(source, formats=["webp"])
+
+    assert image_variants.content_hash(source, widths=(320, 800), formats=["webp"]) != base
+    assert image_variants.content_hash(source, formats=["webp", "avif"]) != base
+
+
+def test_variants_are_smaller_than_original():
+    source = sample_image(1600, 1200)
+
+    _, _, variants = image_variants.generate_variants(source, formats=["webp"])
+
+    assert max(len(v["body"]) for v in variants) < len(source)
+
+
+def test_generate_variants_keeps_alpha():
+    _, _, variants = image_variants.generate_variants(sample_image(400, 200, mode="RGBA"), formats=["webp"])
+
+    with Image.open(io.BytesIO(variants[0]["body"])) as decoded:
+        assert decoded.mode == "RGBA"
+
+
+def test_build_manifest_srcset():
+    source = sample_image(700, 350, fmt="JPEG")
+    digest, size, variants = image_variants.generate_variants(source, formats=["webp"])
+
+    manifest = image_variants.build_manifest("uploads/chant.jpg", digest, size, variants, "https://ourchants.com/")
+
+    assert manifest["source"] == "uploads/chant.jpg"
+    assert (manifest["width"], manifest["height"]) == (700, 350)
+    assert manifest["srcset"]["webp"] == (
+        f"https://ourchants.com/images/{digest}/320w.webp 320w, "
+        f"https://ourchants.com/images/{digest}/640w.webp 640w, "
+        f"https://ourchants.com/images/{digest}/700w.webp 700w"
+    )
+    assert manifest["fallback"] == f"https://ourchants.com/images/{digest}/700w.webp"
+    assert all("body" not in v and v["bytes"] > 0 for v in manifest["variants"])
+
+
+def test_handler_rejects_keys_outside_uploads():
+    response = image_variants.lambda_handler({"source_key": "images/abc/320w.webp"}, None)
+
+    assert "error" in response
@@ -0,0 +1,60 @@
+import pytest
+
+from infrastructure.power_tuning import (
+    invocation_cost,
+    parse_report,
+    pick_memory,
+    summarize,
+)
+
+COLD_LOG = (
+    "START RequestId: abc Version: $LATEST\n"
+    "END RequestId: abc\n"
+    "REPORT RequestId: abc\tDuration: 41.27 ms\tBilled Duration: 42 ms\t"
+    "Memory Size: 512 MB\tMax Memory Used: 78 MB\tInit Duration: 310.55 ms\t\n"
+)
+
+
+def test_parse_report_reads_cold_start_timings():
+    report = parse_report(COLD_LOG)
+
+    assert report["duration_ms"] == 41.27
+    assert report["billed_ms"] == 42
+    assert report["init_ms"] == 310.55
+    assert report["max_memory_mb"] == 78
+
+
+def test_parse_report_requires_report_line():
+    with pytest.raises(ValueError):
+        parse_report("START RequestId: abc\nEND RequestId: abc\n")
+
+
+def test_invocation_cost_scales_with_memory_and_duration():
+    assert invocation_cost(1024, 200) == pytest.approx(invocation_cost(512, 400))
+    assert invocation_cost(2048, 100) > invocation_cost(1024, 100)
+
+
+def test_summarize_uses_billed_durations():
+    summary = summarize(512, [{"billed_ms": 10}, {"billed_ms": 30}, {"billed_ms": 20}])
+
+    assert summary["median_ms"] == 20
+    assert summary["p95_ms"] == 30
+    assert summary["init_ms"] is None
+    assert summary["cost_usd"] == pytest.approx(invocation_cost(512, 20))
+
+
+def test_pick_memory_strategies():
+    results = [
+        summarize(128, [{"billed_ms": 800}]),
+        summarize(512, [{"billed_ms": 150}]),
+        summarize(2048, [{"billed_ms": 100}]),
+    ]
+
+    assert pick_memory(results, "cost")["memory_mb"] == 512
+    assert pick_memory(results, "speed")["memory_mb"] == 2048
+    assert pick_memory(results, "balanced")["memory_mb"] == 512
+
+
+def test_pick_memory_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        pick_memory([summarize(512, [{"billed_ms": 10}])], "cheapest")
@@ -0,0 +1,34 @@
+import pytest
+
+core = pytest.importorskip("aws_cdk")
+assertions = pytest.importorskip("aws_cdk.assertions")
+
+from infrastructure.waveform_config import WaveformPeaksConfig, AUDIO_EXTENSIONS
+
+
+def synth():
+    # Skip Docker bundling of the NumPy/ffmpeg asset; only the template is asserted
+    stack = core.Stack(core.App(context={"aws:cdk:bundling-stacks": []}), "WaveformTest")
+    WaveformPeaksConfig(stack, "songs-test")
+    return assertions.Template.from_stack(stack)
+
+
+def test_function_runs_on_arm64():
+    template = synth()
+
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Handler": "waveform_peaks.lambda_handler",
+        "Architectures": ["arm64"],
+    })
+
+
+def test_notifications_cover_both_extension_cases_only():
+    template = synth()
+
+    notifications = next(iter(template.find_resources("Custom::S3BucketNotifications").values()))
+    configs = notifications["Properties"]["NotificationConfiguration"]["LambdaFunctionConfigurations"]
+    suffixes = sorted(c["Filter"]["Key"]["FilterRules"][0]["Value"] for c in configs)
+
+    assert notifications["Properties"]["BucketName"] == "songs-test"
+    assert suffixes == sorted(AUDIO_EXTENSIONS + tuple(ext.upper() for ext in AUDIO_EXTENSIONS))
+    assert not any(s.endswith(".peaks") for s in suffixes)
@@ -0,0 +1,157 @@
+import io
+import os
+import subprocess
+import wave
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from .lambda_loader import load_lambda
+
+waveform_peaks = load_lambda("waveform_peaks")
+
+
+def sample_wav(seconds, rate=22050, channels=2, amplitude=0.5, noise=False):
+    t = np.arange(int(seconds * rate)) / rate
+    # Amplitude ramps up over the track so peaks differ from start to end
+    if noise:
+        tone = amplitude * (t / seconds) * np.random.default_rng(0).uniform(-1, 1, len(t))
+    else:
+        tone = amplitude * (t / seconds) * np.sin(2 * np.pi * 220 * t)
+    frames = np.repeat((tone * 32767).astype("<i2")[:, None], channels, axis=1)
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(frames.tobytes())
+    return buffer.getvalue()
+
+
+def test_decode_wav_downmixes_to_mono():
+    samples, rate = waveform_peaks.decode_wav(sample_wav(1.5))
+
+    assert rate == 22050
+    assert samples.dtype == np.float32
+    assert len(samples) == int(1.5 * 22050)
+    assert np.abs(samples).max() == pytest.approx(0.5, abs=0.01)
+
+
+def test_compute_peaks_levels_are_consistent():
+    samples = np.random.default_rng(0).uniform(-1, 1, 100_003).astype(np.float32)
+
+    peaks = waveform_peaks.compute_peaks(samples)
+
+    assert [len(level) for level in peaks] == [2048, 512, 128]
+    for level in peaks:
+        assert level.dtype == np.int8
+        assert (level[:, 0] <= level[:, 1]).all()
+    # A coarse bin spans exactly four fine bins
+    fine, coarse = peaks[0], peaks[1]
+    assert (coarse[:, 0] == fine[:, 0].reshape(-1, 4).min(axis=1)).all()
+    assert (coarse[:, 1] == fine[:, 1].reshape(-1, 4).max(axis=1)).all()
+
+
+def test_compute_peaks_handles_short_and_silent_audio():
+    short = waveform_peaks.compute_peaks(np.array([0.5, -0.25], dtype=np.float32))
+    silent = waveform_peaks.compute_peaks(np.array([], dtype=np.float32))
+
+    assert [len(level) for level in short] == [2048, 512, 128]
+    # Fewer samples than bins: each bin holds the sample at its position
+    assert short[-1][0].tolist() == [64, 64]
+    assert short[-1][-1].tolist() == [-32, -32]
+    assert all(not level.any() for level in silent)
+
+
+def test_compute_peaks_rejects_uneven_levels():
+    with pytest.raises(ValueError):
+        waveform_peaks.compute_peaks(np.zeros(10, dtype=np.float32), levels=(1000, 300))
+
+
+def test_analyze_round_trips_sidecar():
+    audio = sample_wav(12.0)
+
+    duration, sidecar = waveform_peaks.analyze(audio, "chants/song.wav")
+    decoded_duration, rate, peaks = waveform_peaks.decode_sidecar(sidecar)
+
+    assert duration == pytest.approx(12.0)
+    assert decoded_duration == pytest.approx(12.0)
+    assert rate == 22050
+    assert len(sidecar) < 6 * 1024 < len(audio) // 100
+    # The ramp makes the end of the track louder than the start
+    overview = peaks[-1]
+    assert overview[-1, 1] > overview[0, 1]
+    assert overview[-1, 1] == pytest.approx(64, abs=2)
+
+
+@pytest.fixture
+def encode_with_ffmpeg(tmp_path):
+    ffmpeg = waveform_peaks._ffmpeg_path()
+    if not ffmpeg:
+        pytest.skip("ffmpeg not available")
+
+    def encode(audio, extension, *args):
+        source = tmp_path / "source.wav"
+        target = tmp_path / f"encoded{extension}"
+        source.write_bytes(audio)
+        subprocess.run([ffmpeg, "-v", "error", "-i", str(source), *args, str(target)], check=True)
+        return target.read_bytes()
+    return encode
+
+
+def test_decodes_m4a_with_trailing_moov_atom(encode_with_ffmpeg):
+    # Noise keeps the file past ffmpeg's probe buffer, where a piped input
+    # silently decodes to nothing
+    audio = encode_with_ffmpeg(sample_wav(20.0, channels=1, noise=True), ".m4a", "-c:a", "aac", "-b:a", "320k")
+    # Default MP4 muxing writes the index after the media data
+    assert audio.index(b"moov") > audio.index(b"mdat")
+
+    duration, sidecar = waveform_peaks.analyze(audio, "chants/song.m4a")
+
+    assert duration == pytest.approx(20.0, abs=0.1)
+    _, rate, peaks = waveform_peaks.decode_sidecar(sidecar)
+    assert rate == waveform_peaks.ANALYSIS_SAMPLE_RATE
+    assert peaks[-1][-1, 1] > 32
+
+
+def test_decodes_mp3_with_uppercase_extension(encode_with_ffmpeg):
+    audio = encode_with_ffmpeg(sample_wav(3.0), ".mp3")
+
+    duration, sidecar = waveform_peaks.analyze(audio, "chants/SONG.MP3")
+
+    assert duration == pytest.approx(3.0, abs=0.1)
+    overview = waveform_peaks.decode_sidecar(sidecar)[2][-1]
+    assert overview[-1, 1] > overview[0, 1]
+
+
+def test_decode_sidecar_rejects_other_data():
+    with pytest.raises(ValueError):
+        waveform_peaks.decode_sidecar(b"RIFF" + bytes(32))
+
+
+def test_handler_skips_sidecars():
+    event = {"Records": [{"s3": {"bucket": {"name": "ourchants-songs"}, "object": {"key": "song.mp3.peaks"}}}]}
+
+    assert waveform_peaks.lambda_handler(event, None)["processed"] == 0
+
+
+def test_process_audio_writes_revalidated_sidecar(monkeypatch):
+    class FakeS3:
+        def get_object(self, Bucket, Key):
+            return {"Body": io.BytesIO(sample_wav(2.0))}
+
+        def put_object(self, **kwargs):
+            self.put = kwargs
+
+    s3 = FakeS3()
+    monkeypatch.setattr(waveform_peaks, "_s3_client", s3)
+
+    result = waveform_peaks.process_audio("ourchants-songs", "chants/song.wav")
+
+    assert result["duration"] == pytest.approx(2.0)
+    assert s3.put["Key"] == "chants/song.wav.peaks"
+    assert s3.put["Metadata"] == {"duration": "2.000"}
+    # The key is reused when a track is replaced, so it must never be cached long-term
+    assert s3.put["CacheControl"] == "no-cache"
@@ -0,0 +1,81 @@
+"""
+Waveform peaks configuration for OurChants website.
+
+This module wires peak precomputation into the existing songs bucket:
+- arm64 Python Lambda running lambda/waveform_peaks.py with NumPy and ffmpeg
+  installed from hash-pinned wheels (lambda/requirements-waveform.txt)
+- S3 notifications for each supported audio extension (sidecars never match)
+- Read access to the audio and write access limited to *.peaks sidecars
+
+The songs bucket is owned by the API stacks, so it is imported by name
+(AUDIO_BUCKET_NAME in .env, default ourchants-songs) and the triggers are
+added through CDK's bucket-notifications custom resource. That resource
+leaves notifications it did not create alone, but if the owning stack ever
+declares its own NotificationConfiguration on the bucket, every deploy of
+that stack replaces these triggers. Move them into the owning stack then.
+
+S3 suffix filters are case-sensitive, so lower- and upper-case extensions
+are registered; mixed-case names such as .Mp3 are not picked up.
+"""
+
+import os
+
+from aws_cdk import (
+    aws_lambda as lambda_,
+    aws_s3 as s3,
+    aws_s3_notifications as s3n,
+    BundlingOptions,
+    Duration,
+    Stack,
+)
+
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a", ".ogg")
+SIDECAR_SUFFIX = ".peaks"
+DEFAULT_AUDIO_BUCKET = "ourchants-songs"
+
+
+class WaveformPeaksConfig:
+    def __init__(self, stack: Stack, bucket_name: str = DEFAULT_AUDIO_BUCKET):
+        self.stack = stack
+        self.bucket = s3.Bucket.from_bucket_name(stack, "SongsAudioBucket", bucket_name)
+        self._setup_function()
+
+    @classmethod
+    def from_env(cls, stack: Stack) -> "WaveformPeaksConfig":
+        """Build the peaks pipeline for the bucket named by AUDIO_BUCKET_NAME."""
+        return cls(stack, os.getenv("AUDIO_BUCKET_NAME", DEFAULT_AUDIO_BUCKET))
+
+    def _setup_function(self):
+        lambda_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lambda")
+
+        self.function = lambda_.Function(
+            self.stack,
+            "WaveformPeaksFunction",
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            handler="waveform_peaks.lambda_handler",
+            code=lambda_.Code.from_asset(
+                lambda_dir,
+                bundling=BundlingOptions(
+                    image=lambda_.Runtime.PYTHON_3_12.bundling_image,
+                    platform="linux/arm64",
+                    command=[
+                        "bash", "-c",
+                        "pip install --require-hashes --only-binary=:all: -r requirements-waveform.txt -t /asset-output"
+                        " && cp waveform_peaks.py /asset-output",
+                    ],
+                ),
+            ),
+            # 1769 MB is one full vCPU, which ffmpeg decoding uses end to end
+            memory_size=1769,
+            timeout=Duration.minutes(5),
+        )
+        self.bucket.grant_read(self.function)
+        self.bucket.grant_put(self.function, f"*{SIDECAR_SUFFIX}")
+
+        for extension in AUDIO_EXTENSIONS + tuple(ext.upper() for ext in AUDIO_EXTENSIONS):
+            self.bucket.add_event_notification(
+                s3.EventType.OBJECT_CREATED,
+                s3n.LambdaDestination(self.function),
+                s3.NotificationKeyFilter(suffix=extension),
+            )
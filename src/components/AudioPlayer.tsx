@@ -39,6 +39,8 @@ import { toast } from 'sonner';
 import { useSafeAudioPlay } from '../hooks/useSafeAudioPlay';
 import { buildAudioSrcFromS3Uri, isValidS3Uri, extractS3Info } from '../utils/audioHelpers';
 import { formatTime } from "../utils/time";
+import { fetchWaveformPeaks, WaveformPeaks } from '../utils/waveformPeaks';
+import { Waveform } from './Waveform';
 import { cn } from "../lib/utils";
 
 type LoopMode = 'off' | 'all' | 'one';
@@ -110,6 +112,7 @@ export function AudioPlayer({
   const [isBuffering, setIsBuffering] = useState(false);
   const [retryCount, setRetryCount] = useState(0);
   const [loopMode, setLoopMode] = useState<LoopMode>('off');
+  const [peaks, setPeaks] = useState<WaveformPeaks | null>(null);
 
   // All refs at the top
   const audioRef = useRef<HTMLAudioElement | null>(null);
@@ -178,6 +181,22 @@ export function AudioPlayer({
     };
   }, [loopMode, onSkipNext]);
 
+  // Waveform and duration from the precomputed .peaks sidecar, available before the audio downloads
+  useEffect(() => {
+    let cancelled = false;
+    setPeaks(null);
+
+    fetchWaveformPeaks(s3Uri).then(result => {
+      if (cancelled || !isMountedRef.current || !result) return;
+      setPeaks(result);
+      setDuration(result.duration);
+    });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [s3Uri]);
+
   // Initialize audio element
   useEffect(() => {
     console.log('AudioPlayer - Initializing audio element', {
@@ -744,6 +763,15 @@ export function AudioPlayer({
             </Button>
           </div>
 
+          {/* Waveform */}
+          {peaks && (
+            <Waveform
+              peaks={peaks}
+              progress={duration ? currentTime / duration : 0}
+              className="mb-1 px-12"
+            />
+          )}
+
           {/* Progress Bar */}
           <div className="w-full flex items-center space-x-2">
             <span className="text-xs text-muted-foreground w-10 text-right">
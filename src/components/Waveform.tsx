@@ -0,0 +1,47 @@
+import React from 'react';
+import { WaveformPeaks, selectPeaksLevel } from '../utils/waveformPeaks';
+import { cn } from '../lib/utils';
+
+interface WaveformProps {
+  peaks: WaveformPeaks;
+  /** Playback position from 0 to 1 */
+  progress: number;
+  bars?: number;
+  className?: string;
+}
+
+/**
+ * Draws a precomputed waveform as min/max bars, shading the played portion
+ */
+export function Waveform({ peaks, progress, bars = 128, className }: WaveformProps) {
+  const level = selectPeaksLevel(peaks, bars);
+  const count = level.length / 2;
+  // A level finer than the bar count is read with a stride
+  const step = Math.max(1, Math.floor(count / bars));
+  const shown = Math.floor(count / step);
+
+  return (
+    <svg
+      className={cn('w-full h-8', className)}
+      viewBox={`0 0 ${shown} 2`}
+      preserveAspectRatio="none"
+      aria-hidden="true"
+      data-testid="waveform"
+    >
+      {Array.from({ length: shown }, (_, i) => {
+        const min = level[i * step * 2];
+        const max = level[i * step * 2 + 1];
+        return (
+          <rect
+            key={i}
+            x={i + 0.15}
+            y={1 - max}
+            width={0.7}
+            height={Math.max(max - min, 0.04)}
+            className={i / shown < progress ? 'fill-spotify-green' : 'fill-muted-foreground/40'}
+          />
+        );
+      })}
+    </svg>
+  );
+}
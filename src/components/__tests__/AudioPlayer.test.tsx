@@ -32,12 +32,19 @@ import { render, screen, fireEvent } from '@testing-library/react';
 import { AudioPlayer } from '../AudioPlayer';
 import { describe, it, expect, vi, beforeEach } from 'vitest';
 import { getPresignedUrl } from '../../services/songApi';
+import { fetchWaveformPeaks } from '../../utils/waveformPeaks';
 
 // Mock the getPresignedUrl function
 vi.mock('../../services/songApi', () => ({
   getPresignedUrl: vi.fn().mockResolvedValue({ url: 'https://test-url.com/audio.mp3' })
 }));
 
+// Mock the waveform sidecar fetch so tests never hit the network
+vi.mock('../../utils/waveformPeaks', async (importOriginal) => ({
+  ...(await importOriginal<typeof import('../../utils/waveformPeaks')>()),
+  fetchWaveformPeaks: vi.fn().mockResolvedValue(null)
+}));
+
 // Mock HTMLMediaElement methods and state
 const mockAudio = {
   play: vi.fn().mockResolvedValue(undefined),
@@ -107,6 +114,20 @@ describe('AudioPlayer', () => {
     expect(timeElements[1]).toHaveClass('text-muted-foreground'); // Duration
   });
 
+  it('shows duration and waveform from precomputed peaks before audio loads', async () => {
+    vi.mocked(fetchWaveformPeaks).mockResolvedValueOnce({
+      duration: 182,
+      sampleRate: 8000,
+      levels: [new Float32Array([-0.5, 0.5, -1, 1])]
+    });
+
+    render(<AudioPlayer {...mockProps} />);
+
+    expect(await screen.findByText('3:02')).toBeInTheDocument();
+    expect(screen.getByTestId('waveform')).toBeInTheDocument();
+    expect(fetchWaveformPeaks).toHaveBeenCalledWith(mockProps.s3Uri);
+  });
+
   it('handles skip controls', () => {
     const onSkipNext = vi.fn();
     const onSkipPrevious = vi.fn();
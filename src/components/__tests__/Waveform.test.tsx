@@ -0,0 +1,41 @@
+import React from 'react';
+import { render, screen } from '@testing-library/react';
+import { Waveform } from '../Waveform';
+import { describe, it, expect } from 'vitest';
+
+const peaks = {
+  duration: 60,
+  sampleRate: 8000,
+  levels: [
+    Float32Array.from({ length: 16 }, (_, i) => (i % 2 ? 0.5 : -0.5)),
+    Float32Array.from({ length: 8 }, (_, i) => (i % 2 ? 1 : -1))
+  ]
+};
+
+describe('Waveform', () => {
+  it('draws one bar per bin of the selected level', () => {
+    render(<Waveform peaks={peaks} progress={0} bars={4} />);
+
+    const bars = screen.getByTestId('waveform').querySelectorAll('rect');
+    expect(bars).toHaveLength(4);
+    expect(bars[0]).toHaveAttribute('height', '2');
+  });
+
+  it('reads finer levels with a stride when there are fewer bars', () => {
+    render(<Waveform peaks={peaks} progress={0} bars={2} />);
+
+    expect(screen.getByTestId('waveform').querySelectorAll('rect')).toHaveLength(2);
+  });
+
+  it('shades the played portion', () => {
+    render(<Waveform peaks={peaks} progress={0.5} bars={4} />);
+
+    const bars = Array.from(screen.getByTestId('waveform').querySelectorAll('rect'));
+    expect(bars.map(bar => bar.getAttribute('class'))).toEqual([
+      'fill-spotify-green',
+      'fill-spotify-green',
+      'fill-muted-foreground/40',
+      'fill-muted-foreground/40'
+    ]);
+  });
+});
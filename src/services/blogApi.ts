@@ -8,6 +8,12 @@ export interface BlogPost {
   created_at: string;
   tags: string[];
   image_url?: string;
+  /** S3 key of an original uploaded under uploads/; only sent when creating a post */
+  image_key?: string;
+  /** srcset strings keyed by format (avif, webp) for the resized variants of image_url */
+  image_srcset?: Record<string, string>;
+  image_width?: number;
+  image_height?: number;
 }
 
 export const fetchBlogPosts = async (): Promise<BlogPost[]> => {
@@ -0,0 +1,52 @@
+import { parseWaveformPeaks, selectPeaksLevel } from '../waveformPeaks';
+
+function buildSidecar(duration: number, sampleRate: number, levels: number[][]): ArrayBuffer {
+  const size = 16 + 4 * levels.length + levels.reduce((total, level) => total + level.length, 0);
+  const buffer = new ArrayBuffer(size);
+  const view = new DataView(buffer);
+
+  'OCPK'.split('').forEach((char, i) => view.setUint8(i, char.charCodeAt(0)));
+  view.setUint8(4, 1);
+  view.setUint8(5, levels.length);
+  view.setFloat32(8, duration, true);
+  view.setUint32(12, sampleRate, true);
+
+  let offset = 16 + 4 * levels.length;
+  levels.forEach((level, i) => {
+    view.setUint32(16 + 4 * i, level.length / 2, true);
+    level.forEach(value => view.setInt8(offset++, value));
+  });
+  return buffer;
+}
+
+describe('parseWaveformPeaks', () => {
+  it('reads duration, sample rate and every level', () => {
+    const buffer = buildSidecar(182.5, 8000, [[-127, 127, -64, 64, 0, 0, -1, 1], [-127, 127, -1, 1]]);
+
+    const peaks = parseWaveformPeaks(buffer);
+
+    expect(peaks.duration).toBeCloseTo(182.5);
+    expect(peaks.sampleRate).toBe(8000);
+    expect(peaks.levels.map(level => level.length)).toEqual([8, 4]);
+    expect(peaks.levels[1][0]).toBe(-1);
+    expect(peaks.levels[1][1]).toBe(1);
+    expect(peaks.levels[0][3]).toBeCloseTo(64 / 127);
+  });
+
+  it('rejects data that is not a sidecar', () => {
+    expect(() => parseWaveformPeaks(new ArrayBuffer(16))).toThrow('Not a version 1 waveform peaks sidecar');
+  });
+});
+
+describe('selectPeaksLevel', () => {
+  const peaks = parseWaveformPeaks(buildSidecar(10, 8000, [new Array(16).fill(0), new Array(8).fill(0), new Array(4).fill(0)]));
+
+  it('uses the coarsest level that covers the width', () => {
+    expect(selectPeaksLevel(peaks, 2).length).toBe(4);
+    expect(selectPeaksLevel(peaks, 3).length).toBe(8);
+  });
+
+  it('falls back to the finest level for wide waveforms', () => {
+    expect(selectPeaksLevel(peaks, 100).length).toBe(16);
+  });
+});
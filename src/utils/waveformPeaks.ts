@@ -0,0 +1,80 @@
+import { getPresignedUrl } from '../services/songApi';
+import { extractS3Info } from './audioHelpers';
+
+/**
+ * Precomputed waveform for a song, read from the <audio>.peaks sidecar
+ * written by infrastructure/lambda/waveform_peaks.py.
+ */
+export interface WaveformPeaks {
+  /** Track length in seconds, known before any audio downloads */
+  duration: number;
+  sampleRate: number;
+  /** Interleaved min/max pairs in [-1, 1] per resolution, finest first */
+  levels: Float32Array[];
+}
+
+const MAGIC = 'OCPK';
+const FORMAT_VERSION = 1;
+const HEADER_SIZE = 16;
+
+/**
+ * Parses a version 1 peaks sidecar
+ * @param buffer The raw sidecar bytes
+ * @returns The decoded waveform
+ */
+export function parseWaveformPeaks(buffer: ArrayBuffer): WaveformPeaks {
+  if (buffer.byteLength < HEADER_SIZE) {
+    throw new Error('Not a version 1 waveform peaks sidecar');
+  }
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+  if (magic !== MAGIC || view.getUint8(4) !== FORMAT_VERSION) {
+    throw new Error('Not a version 1 waveform peaks sidecar');
+  }
+
+  const levelCount = view.getUint8(5);
+  const duration = view.getFloat32(8, true);
+  const sampleRate = view.getUint32(12, true);
+
+  let offset = HEADER_SIZE + 4 * levelCount;
+  const levels: Float32Array[] = [];
+  for (let i = 0; i < levelCount; i++) {
+    const bins = view.getUint32(HEADER_SIZE + 4 * i, true);
+    const pairs = new Int8Array(buffer, offset, bins * 2);
+    levels.push(Float32Array.from(pairs, value => value / 127));
+    offset += bins * 2;
+  }
+
+  return { duration, sampleRate, levels };
+}
+
+/**
+ * Picks the coarsest level that still has at least one bin per pixel
+ * @param peaks The decoded waveform
+ * @param width The number of pixels (or bars) to draw
+ * @returns Interleaved min/max pairs for that level
+ */
+export function selectPeaksLevel(peaks: WaveformPeaks, width: number): Float32Array {
+  const byResolution = [...peaks.levels].sort((a, b) => a.length - b.length);
+  return byResolution.find(level => level.length / 2 >= width) ?? byResolution[byResolution.length - 1];
+}
+
+/**
+ * Fetches the peaks sidecar stored next to a song's audio
+ * @param s3Uri The song's S3 URI (e.g., s3://ourchants-songs/song.mp3)
+ * @returns The decoded waveform, or null if it has not been generated
+ */
+export async function fetchWaveformPeaks(s3Uri: string): Promise<WaveformPeaks | null> {
+  const s3Info = extractS3Info(s3Uri);
+  if (!s3Info) return null;
+
+  try {
+    const { url } = await getPresignedUrl(s3Info.bucket, `${s3Info.key}.peaks`);
+    const response = await fetch(url);
+    if (!response.ok) return null;
+    return parseWaveformPeaks(await response.arrayBuffer());
+  } catch (error) {
+    console.error('Error fetching waveform peaks:', error);
+    return null;
+  }
+}